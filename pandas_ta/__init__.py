@@ -3,21 +3,17 @@ name = "pandas_ta"
 .. moduleauthor:: Kevin Johnson
 """
 from importlib.util import find_spec
-from pathlib import Path
-from pkg_resources import get_distribution, DistributionNotFound
 
-
-_dist = get_distribution("pandas_ta")
+# importlib.metadata avoids the import cost of pkg_resources (Python 3.8+)
 try:
-    # Normalize case for Windows systems
-    here = Path(_dist.location) / __file__
-    if not here.exists():
-        # not installed, but there is another version that *is*
-        raise DistributionNotFound
-except DistributionNotFound:
-    __version__ = "Please install this project with setup.py"
+    from importlib.metadata import version as _dist_version
+except ImportError:
+    from pkg_resources import get_distribution
+
+    def _dist_version(name):
+        return get_distribution(name).version
 
-version = __version__ = _dist.version
+version = __version__ = _dist_version("pandas_ta")
 
 Imports = {
     "alphaVantage-api": find_spec("alphaVantageAPI") is not None,
@@ -1,4 +1,7 @@
 # -*- coding: utf-8 -*-
+from numpy import empty as npEmpty
+from numpy import fmax as npFmax
+from numpy import fmin as npFmin
 from pandas import DataFrame
 from pandas_ta.utils import get_offset, verify_series
 
@@ -14,18 +17,21 @@ def ha(open_, high, low, close, offset=None, **kwargs):
 
     # Calculate Result
     m = close.size
-    df = DataFrame({
-        "HA_open": 0.5 * (open_.iloc[0] + close.iloc[0]),
-        "HA_high": high,
-        "HA_low": low,
-        "HA_close": 0.25 * (open_ + high + low + close),
-    })
-
+    np_open, np_high = open_.values, high.values
+    np_low, np_close = low.values, close.values
+    # One Fortran ordered block, each column is a contiguous view
+    result = npEmpty((m, 4), order="F")
+    ha_open, ha_high, ha_low, ha_close = result.T
+
+    # Only HA_open is a recurrence; then NaN skipping HA_high/HA_low
+    ha_close[:] = 0.25 * (np_open + np_high + np_low + np_close)
+    ha_open[0] = 0.5 * (np_open[0] + np_close[0])
     for i in range(1, m):
-        df["HA_open"][i] = 0.5 * (df["HA_open"][i - 1] + df["HA_close"][i - 1])
+        ha_open[i] = 0.5 * (ha_open[i - 1] + ha_close[i - 1])
+    npFmax(npFmax(ha_open, np_high), ha_close, out=ha_high)
+    npFmin(npFmin(ha_open, np_low), ha_close, out=ha_low)
 
-    df["HA_high"] = df[["HA_open", "HA_high", "HA_close"]].max(axis=1)
-    df["HA_low"] = df[["HA_open", "HA_low", "HA_close"]].min(axis=1)
+    df = DataFrame(result, index=close.index, columns=["HA_open", "HA_high", "HA_low", "HA_close"])
 
     # Offset
     if offset != 0:
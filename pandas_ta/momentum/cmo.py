@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+from numpy import maximum as npMaximum
+from pandas import DataFrame, Series
 from pandas_ta import Imports
 from pandas_ta.overlap import rma
 from pandas_ta.utils import get_drift, get_offset, verify_series
@@ -21,16 +23,17 @@ def cmo(close, length=None, scalar=None, talib=None, drift=None, offset=None, **
         from talib import CMO
         cmo = CMO(close, length)
     else:
-        mom = close.diff(drift)
-        positive = mom.copy().clip(lower=0)
-        negative = mom.copy().clip(upper=0).abs()
+        mom = close.diff(drift).values
+        positive = Series(npMaximum(mom, 0), index=close.index)
+        negative = Series(npMaximum(-mom, 0), index=close.index)
 
         if mode_tal:
             pos_ = rma(positive, length)
             neg_ = rma(negative, length)
         else:
-            pos_ = positive.rolling(length).sum()
-            neg_ = negative.rolling(length).sum()
+            # Both window sums from a single rolling pass
+            sums = DataFrame({"pos": positive, "neg": negative}).rolling(length).sum()
+            pos_, neg_ = sums["pos"], sums["neg"]
 
         cmo = scalar * (pos_ - neg_) / (pos_ + neg_)
 
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas import DataFrame
+from pandas import DataFrame, Series
 from pandas_ta.overlap import ema
 from pandas_ta.utils import get_offset, verify_series
 
@@ -16,9 +16,9 @@ def eri(high, low, close, length=None, offset=None, **kwargs):
     if high is None or low is None or close is None: return
 
     # Calculate Result
-    ema_ = ema(close, length)
-    bull = high - ema_
-    bear = low - ema_
+    ema_ = ema(close, length).values
+    bull = Series(high.values - ema_, index=high.index)
+    bear = Series(low.values - ema_, index=low.index)
 
     # Offset
     if offset != 0:
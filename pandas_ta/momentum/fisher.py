@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+from numpy import full as npFull
 from numpy import log as nplog
 from numpy import nan as npNaN
 from pandas import DataFrame, Series
@@ -30,12 +31,14 @@ def fisher(high, low, length=None, signal=None, offset=None, **kwargs):
 
     v = 0
     m = high.size
-    result = [npNaN for _ in range(0, length - 1)] + [0]
+    result = npFull(m, npNaN)
+    result[length - 1] = 0
+    np_position = position.values
     for i in range(length, m):
-        v = 0.66 * position.iloc[i] + 0.67 * v
+        v = 0.66 * np_position[i] + 0.67 * v
         if v < -0.99: v = -0.999
         if v > 0.99: v = 0.999
-        result.append(0.5 * (nplog((1 + v) / (1 - v)) + result[i - 1]))
+        result[i] = 0.5 * (nplog((1 + v) / (1 - v)) + result[i - 1])
     fisher = Series(result, index=high.index)
     signalma = fisher.shift(signal)
 
@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
+from numpy import full as npFull
 from numpy import maximum as npMaximum
 from numpy import minimum as npMinimum
 from numpy import nan as npNaN
+from numpy import ones as npOnes
+from numpy import zeros as npZeros
 from pandas import DataFrame, Series
 
 from .rsi import rsi
@@ -41,52 +44,54 @@ def qqe(close, length=None, smooth=None, factor=None, mamode=None, drift=None, o
     lowerband = rsi_ma - dar
 
     m = close.size
-    long = Series(0, index=close.index)
-    short = Series(0, index=close.index)
-    trend = Series(1, index=close.index)
-    qqe = Series(rsi_ma.iloc[0], index=close.index)
-    qqe_long = Series(npNaN, index=close.index)
-    qqe_short = Series(npNaN, index=close.index)
+    long, short = npZeros(m), npZeros(m)
+    trend = npOnes(m, dtype=int)
+    qqe = npFull(m, rsi_ma.iloc[0])
+    qqe_long, qqe_short = npFull(m, npNaN), npFull(m, npNaN)
+    np_rsi_ma = rsi_ma.values
+    upperband, lowerband = upperband.values, lowerband.values
 
     for i in range(1, m):
-        c_rsi, p_rsi = rsi_ma.iloc[i], rsi_ma.iloc[i - 1]
-        c_long, p_long = long.iloc[i - 1], long.iloc[i - 2]
-        c_short, p_short = short.iloc[i - 1], short.iloc[i - 2]
+        c_rsi, p_rsi = np_rsi_ma[i], np_rsi_ma[i - 1]
+        c_long, p_long = long[i - 1], long[i - 2]
+        c_short, p_short = short[i - 1], short[i - 2]
 
         # Long Line
         if p_rsi > c_long and c_rsi > c_long:
-            long.iloc[i] = npMaximum(c_long, lowerband.iloc[i])
+            long[i] = npMaximum(c_long, lowerband[i])
         else:
-            long.iloc[i] = lowerband.iloc[i]
+            long[i] = lowerband[i]
 
         # Short Line
         if p_rsi < c_short and c_rsi < c_short:
-            short.iloc[i] = npMinimum(c_short, upperband.iloc[i])
+            short[i] = npMinimum(c_short, upperband[i])
         else:
-            short.iloc[i] = upperband.iloc[i]
+            short[i] = upperband[i]
 
         # Trend & QQE Calculation
         # Long: Current RSI_MA value Crosses the Prior Short Line Value
         # Short: Current RSI_MA Crosses the Prior Long Line Value
         if (c_rsi > c_short and p_rsi < p_short) or (c_rsi <= c_short and p_rsi >= p_short):
-            trend.iloc[i] = 1
-            qqe.iloc[i] = qqe_long.iloc[i] = long.iloc[i]
+            trend[i] = 1
+            qqe[i] = qqe_long[i] = long[i]
         elif (c_rsi > c_long and p_rsi < p_long) or (c_rsi <= c_long and p_rsi >= p_long):
-            trend.iloc[i] = -1
-            qqe.iloc[i] = qqe_short.iloc[i] = short.iloc[i]
+            trend[i] = -1
+            qqe[i] = qqe_short[i] = short[i]
         else:
-            trend.iloc[i] = trend.iloc[i - 1]
-            if trend.iloc[i] == 1:
-                qqe.iloc[i] = qqe_long.iloc[i] = long.iloc[i]
+            trend[i] = trend[i - 1]
+            if trend[i] == 1:
+                qqe[i] = qqe_long[i] = long[i]
             else:
-                qqe.iloc[i] = qqe_short.iloc[i]  = short.iloc[i]
+                qqe[i] = qqe_short[i]  = short[i]
+
+    qqe = Series(qqe, index=close.index)
+    qqe_long = Series(qqe_long, index=close.index)
+    qqe_short = Series(qqe_short, index=close.index)
 
     # Offset
     if offset != 0:
         rsi_ma = rsi_ma.shift(offset)
         qqe = qqe.shift(offset)
-        long = long.shift(offset)
-        short = short.shift(offset)
 
     # Handle fills
     if "fillna" in kwargs:
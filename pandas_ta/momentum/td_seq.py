@@ -1,5 +1,9 @@
 # -*- coding: utf-8 -*-
 # import numpy as np
+from numpy import arange as npArange
+from numpy import maximum as npMaximum
+from numpy import minimum as npMinimum
+from numpy import nan as npNaN
 from numpy import where as npWhere
 from pandas import DataFrame, Series
 from pandas_ta.utils import get_offset, verify_series
@@ -13,31 +17,22 @@ def td_seq(close, asint=None, offset=None, **kwargs):
     asint = asint if isinstance(asint, bool) else False
     show_all = kwargs.setdefault("show_all", True)
 
-    def true_sequence_count(series: Series):
-        index = series.where(series == False).last_valid_index()
+    # Both directions share one 4 bar difference and one bar counter
+    diff4 = close.diff(4).values
+    bars = npArange(diff4.size)
 
-        if index is None:
-            return series.count()
-        else:
-            s = series[series.index > index]
-            return s.count()
+    def calc_td(td_bool, show_all: bool):
+        # Length of the current run of True, capped at the 13 bar window
+        last_false = npMaximum.accumulate(npWhere(td_bool, -1, bars))
+        td_num = npMinimum(bars - last_false, 13)
 
-    def calc_td(series: Series, direction: str, show_all: bool):
-        td_bool = series.diff(4) > 0 if direction=="up" else series.diff(4) < 0
-        td_num = npWhere(
-            td_bool, td_bool.rolling(13, min_periods=0).apply(true_sequence_count), 0
-        )
-        td_num = Series(td_num)
+        if not show_all:
+            td_bool &= (td_num >= 6) & (td_num <= 9)
 
-        if show_all:
-            td_num = td_num.mask(td_num == 0)
-        else:
-            td_num = td_num.mask(~td_num.between(6,9))
+        return Series(npWhere(td_bool, td_num, npNaN))
 
-        return td_num
-
-    up_seq = calc_td(close, "up", show_all)
-    down_seq = calc_td(close, "down", show_all)
+    up_seq = calc_td(diff4 > 0, show_all)
+    down_seq = calc_td(diff4 < 0, show_all)
 
     if asint:
         if up_seq.hasnans and down_seq.hasnans:
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
-from pandas import DataFrame
+from numpy import fmax as npFmax
+from numpy import fmin as npFmin
+from pandas import Series
 from pandas_ta import Imports
 from pandas_ta.utils import get_drift, get_offset, verify_series
 
@@ -28,14 +30,10 @@ def uo(high, low, close, fast=None, medium=None, slow=None, fast_w=None, medium_
         from talib import ULTOSC
         uo = ULTOSC(high, low, close, fast, medium, slow)
     else:
-        tdf = DataFrame({
-            "high": high,
-            "low": low,
-            f"close_{drift}": close.shift(drift)
-        })
-        max_h_or_pc = tdf.loc[:, ["high", f"close_{drift}"]].max(axis=1)
-        min_l_or_pc = tdf.loc[:, ["low", f"close_{drift}"]].min(axis=1)
-        del tdf
+        # npFmax/npFmin skip the leading NaNs of the shifted close
+        prev_close = close.shift(drift).values
+        max_h_or_pc = Series(npFmax(high.values, prev_close), index=close.index)
+        min_l_or_pc = Series(npFmin(low.values, prev_close), index=close.index)
 
         bp = close - min_l_or_pc
         tr = max_h_or_pc - min_l_or_pc
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+from pandas import Series
 from .ema import ema
 from pandas_ta import Imports
 from pandas_ta.utils import get_offset, verify_series
@@ -21,7 +22,7 @@ def dema(close, length=None, talib=None, offset=None, **kwargs):
     else:
         ema1 = ema(close=close, length=length)
         ema2 = ema(close=ema1, length=length)
-        dema = 2 * ema1 - ema2
+        dema = Series(2 * ema1.values - ema2.values, index=close.index)
 
     # Offset
     if offset != 0:
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from numpy import nan as npNaN
+from pandas import Series
 from pandas_ta import Imports
 from pandas_ta.utils import get_offset, verify_series
 
@@ -22,10 +23,11 @@ def ema(close, length=None, talib=None, offset=None, **kwargs):
         ema = EMA(close, length)
     else:
         if sma:
-            close = close.copy()
-            sma_nth = close[0:length].mean()
-            close[:length - 1] = npNaN
-            close.iloc[length - 1] = sma_nth
+            # Seed on a raw copy to avoid pandas indexed assignment
+            seeded = close.to_numpy(dtype=float, copy=True)
+            seeded[length - 1] = close.iloc[:length].mean()
+            seeded[:length - 1] = npNaN
+            close = Series(seeded, index=close.index)
         ema = close.ewm(span=length, adjust=adjust).mean()
 
     # Offset
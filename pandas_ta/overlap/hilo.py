@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
+from numpy import full as npFull
 from numpy import nan as npNaN
-from pandas import DataFrame, Series
+from pandas import DataFrame
 from .ma import ma
 from pandas_ta.utils import get_offset, verify_series
 
@@ -21,43 +22,35 @@ def hilo(high, low, close, high_length=None, low_length=None, mamode=None, offse
 
     # Calculate Result
     m = close.size
-    hilo = Series(npNaN, index=close.index)
-    long = Series(npNaN, index=close.index)
-    short = Series(npNaN, index=close.index)
+    hilo, long, short = npFull(m, npNaN), npFull(m, npNaN), npFull(m, npNaN)
 
-    high_ma = ma(mamode, high, length=high_length)
-    low_ma = ma(mamode, low, length=low_length)
+    high_ma = ma(mamode, high, length=high_length).values
+    low_ma = ma(mamode, low, length=low_length).values
+    np_close = close.values
 
     for i in range(1, m):
-        if close.iloc[i] > high_ma.iloc[i - 1]:
-            hilo.iloc[i] = long.iloc[i] = low_ma.iloc[i]
-        elif close.iloc[i] < low_ma.iloc[i - 1]:
-            hilo.iloc[i] = short.iloc[i] = high_ma.iloc[i]
+        if np_close[i] > high_ma[i - 1]:
+            hilo[i] = long[i] = low_ma[i]
+        elif np_close[i] < low_ma[i - 1]:
+            hilo[i] = short[i] = high_ma[i]
         else:
-            hilo.iloc[i] = hilo.iloc[i - 1]
-            long.iloc[i] = short.iloc[i] = hilo.iloc[i - 1]
+            hilo[i] = long[i] = short[i] = hilo[i - 1]
+
+    _props = f"_{high_length}_{low_length}"
+    data = {f"HILO{_props}": hilo, f"HILOl{_props}": long, f"HILOs{_props}": short}
+    df = DataFrame(data, index=close.index)
 
     # Offset
     if offset != 0:
-        hilo = hilo.shift(offset)
-        long = long.shift(offset)
-        short = short.shift(offset)
+        df = df.shift(offset)
 
     # Handle fills
     if "fillna" in kwargs:
-        hilo.fillna(kwargs["fillna"], inplace=True)
-        long.fillna(kwargs["fillna"], inplace=True)
-        short.fillna(kwargs["fillna"], inplace=True)
+        df.fillna(kwargs["fillna"], inplace=True)
     if "fill_method" in kwargs:
-        hilo.fillna(method=kwargs["fill_method"], inplace=True)
-        long.fillna(method=kwargs["fill_method"], inplace=True)
-        short.fillna(method=kwargs["fill_method"], inplace=True)
+        df.fillna(method=kwargs["fill_method"], inplace=True)
 
     # Name & Category
-    _props = f"_{high_length}_{low_length}"
-    data = {f"HILO{_props}": hilo, f"HILOl{_props}": long, f"HILOs{_props}": short}
-    df = DataFrame(data, index=close.index)
-
     df.name = f"HILO{_props}"
     df.category = "overlap"
 
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from numpy import sqrt as npSqrt
+from pandas import Series
 from .wma import wma
 from pandas_ta.utils import get_offset, verify_series
 
@@ -19,7 +20,8 @@ def hma(close, length=None, offset=None, **kwargs):
 
     wmaf = wma(close=close, length=half_length)
     wmas = wma(close=close, length=length)
-    hma = wma(close=2 * wmaf - wmas, length=sqrt_length)
+    hma_diff = Series(2 * wmaf.values - wmas.values, index=close.index)
+    hma = wma(close=hma_diff, length=sqrt_length)
 
     # Offset
     if offset != 0:
@@ -17,11 +17,12 @@ def hwma(close, na=None, nb=None, nc=None, offset=None, **kwargs):
     last_f = close.iloc[0]
 
     result = []
-    m = close.size
+    m, np_close = close.size, close.values
+    _na, _nb, _nc = 1.0 - na, 1.0 - nb, 1.0 - nc
     for i in range(m):
-        F = (1.0 - na) * (last_f + last_v + 0.5 * last_a) + na * close.iloc[i]
-        V = (1.0 - nb) * (last_v + last_a) + nb * (F - last_f)
-        A = (1.0 - nc) * last_a + nc * (V - last_v)
+        F = _na * (last_f + last_v + 0.5 * last_a) + na * np_close[i]
+        V = _nb * (last_v + last_a) + nb * (F - last_f)
+        A = _nc * last_a + nc * (V - last_v)
         result.append((F + V + 0.5 * A))
         last_a, last_f, last_v = A, F, V # update values
 
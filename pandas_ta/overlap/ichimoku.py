@@ -3,6 +3,8 @@ from pandas import date_range, DataFrame, RangeIndex, Timedelta
 from .midprice import midprice
 from pandas_ta.utils import get_offset, verify_series
 
+_ONE_DAY = Timedelta(1, unit="d")
+
 
 def ichimoku(high, low, close, tenkan=None, kijun=None, senkou=None, include_chikou=True, offset=None, **kwargs):
     """Indicator: Ichimoku Kinkō Hyō (Ichimoku)"""
@@ -82,8 +84,13 @@ def ichimoku(high, low, close, tenkan=None, kijun=None, senkou=None, include_chi
         spandf = DataFrame(index=ext_index, columns=[span_a.name, span_b.name])
         _span_a.index = _span_b.index = ext_index
     else:
-        df_freq = close.index.value_counts().mode()[0]
-        tdelta = Timedelta(df_freq, unit="d")
+        # is_unique is cached on the index, so the common case (no repeated
+        # timestamps, modal count of 1) skips the value_counts scan
+        if close.index.is_unique:
+            tdelta = _ONE_DAY
+        else:
+            df_freq = close.index.value_counts().mode()[0]
+            tdelta = Timedelta(df_freq, unit="d")
         new_dt = date_range(start=last + tdelta, periods=kijun, freq="B")
         spandf = DataFrame(index=new_dt, columns=[span_a.name, span_b.name])
         _span_a.index = _span_b.index = new_dt
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from numpy import average as npAverage
+from numpy import empty as npEmpty
 from numpy import nan as npNaN
 from numpy import log as npLog
 from numpy import power as npPower
@@ -19,12 +20,14 @@ def jma(close, length=None, phase=None, offset=None, **kwargs):
     if close is None: return
 
     # Define base variables
-    jma = npZeroslike(close)
-    volty = npZeroslike(close)
-    v_sum = npZeroslike(close)
+    # Every jma value is written below, only the recurrences need zeros
+    np_close = close.values
+    jma = npEmpty(np_close.shape)
+    volty = npZeroslike(np_close)
+    v_sum = npZeroslike(np_close)
 
     kv = det0 = det1 = ma2 = 0.0
-    jma[0] = ma1 = uBand = lBand = close[0]
+    jma[0] = ma1 = uBand = lBand = np_close[0]
 
     # Static variables
     sum_length = 10
@@ -38,7 +41,7 @@ def jma(close, length=None, phase=None, offset=None, **kwargs):
 
     m = close.shape[0]
     for i in range(1, m):
-        price = close[i]
+        price = np_close[i]
 
         # Price volatility
         del1 = price - uBand
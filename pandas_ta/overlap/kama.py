@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+from numpy import full as npFull
 from numpy import nan as npNaN
 from pandas import Series
 from pandas_ta.utils import get_drift, get_offset, non_zero_range, verify_series
@@ -31,9 +32,11 @@ def kama(close, length=None, fast=None, slow=None, drift=None, offset=None, **kw
     sc = x * x
 
     m = close.size
-    result = [npNaN for _ in range(0, length - 1)] + [0]
+    result = npFull(m, npNaN)
+    result[length - 1] = 0
+    np_sc, np_close = sc.values, close.values
     for i in range(length, m):
-        result.append(sc.iloc[i] * close.iloc[i] + (1 - sc.iloc[i]) * result[i - 1])
+        result[i] = np_sc[i] * np_close[i] + (1 - np_sc[i]) * result[i - 1]
 
     kama = Series(result, index=close.index)
 
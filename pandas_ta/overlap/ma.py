@@ -19,6 +19,14 @@ from .vidya import vidya
 from .wma import wma
 from .zlma import zlma
 
+# Module level lookup so ma() does not walk an if/elif chain per call
+_MAS = {
+    "dema": dema, "ema": ema, "fwma": fwma, "hma": hma, "linreg": linreg,
+    "midpoint": midpoint, "pwma": pwma, "rma": rma, "sinwma": sinwma,
+    "sma": sma, "swma": swma, "t3": t3, "tema": tema, "trima": trima,
+    "vidya": vidya, "wma": wma, "zlma": zlma
+}
+
 
 def ma(name:str = None, source:Series = None, **kwargs) -> Series:
     """Simple MA Utility for easier MA selection
@@ -43,31 +51,11 @@ def ma(name:str = None, source:Series = None, **kwargs) -> Series:
         pd.Series: New feature generated.
     """
 
-    _mas = [
-        "dema", "ema", "fwma", "hma", "linreg", "midpoint", "pwma", "rma",
-        "sinwma", "sma", "swma", "t3", "tema", "trima", "vidya", "wma", "zlma"
-    ]
     if name is None and source is None:
-        return _mas
-    elif isinstance(name, str) and name.lower() in _mas:
+        return list(_MAS)
+    elif isinstance(name, str) and name.lower() in _MAS:
         name = name.lower()
     else: # "ema"
-        name = _mas[1]
+        name = "ema"
 
-    if   name == "dema": return dema(source, **kwargs)
-    elif name == "fwma": return fwma(source, **kwargs)
-    elif name == "hma": return hma(source, **kwargs)
-    elif name == "linreg": return linreg(source, **kwargs)
-    elif name == "midpoint": return midpoint(source, **kwargs)
-    elif name == "pwma": return pwma(source, **kwargs)
-    elif name == "rma": return rma(source, **kwargs)
-    elif name == "sinwma": return sinwma(source, **kwargs)
-    elif name == "sma": return sma(source, **kwargs)
-    elif name == "swma": return swma(source, **kwargs)
-    elif name == "t3": return t3(source, **kwargs)
-    elif name == "tema": return tema(source, **kwargs)
-    elif name == "trima": return trima(source, **kwargs)
-    elif name == "vidya": return vidya(source, **kwargs)
-    elif name == "wma": return wma(source, **kwargs)
-    elif name == "zlma": return zlma(source, **kwargs)
-    else: return ema(source, **kwargs)
\ No newline at end of file
+    return _MAS[name](source, **kwargs)
\ No newline at end of file
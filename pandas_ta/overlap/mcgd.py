@@ -1,4 +1,8 @@
 # -*- coding: utf-8 -*-
+from numpy import full as npFull
+from numpy import isnan as npIsnan
+from numpy import nan as npNaN
+from pandas import Series
 from pandas_ta.utils import get_offset, verify_series
 
 
@@ -13,15 +17,19 @@ def mcgd(close, length=None, offset=None, c=None, **kwargs):
     if close is None: return
 
     # Calculate Result
-    close = close.copy()
-
-    def mcg_(series):
-        denom = (c * length * (series.iloc[1] / series.iloc[0]) ** 4)
-        series.iloc[1] = (series.iloc[0] + ((series.iloc[1] - series.iloc[0]) / denom))
-        return series.iloc[1]
-
-    mcg_cell = close[0:].rolling(2, min_periods=2).apply(mcg_, raw=False)
-    mcg_ds = close[:1].append(mcg_cell[1:])
+    m = close.size
+    np_close = close.values
+    mcg = np_close.astype(float)
+    result = npFull(m, npNaN)
+    result[0] = np_close[0]
+
+    # Recurrence on the raw arrays rather than rolling(2).apply() which
+    # builds a Series for every window. Windows with a NaN are skipped.
+    for i in range(1, m):
+        prev_, curr_ = mcg[i - 1], np_close[i]
+        if npIsnan(prev_) or npIsnan(curr_): continue
+        mcg[i] = result[i] = prev_ + (curr_ - prev_) / (c * length * (curr_ / prev_) ** 4)
+    mcg_ds = Series(result, index=close.index)
 
     # Offset
     if offset != 0:
@@ -60,12 +68,8 @@ Calculation:
         offset=0
         c=1
 
-    def mcg_(series):
-        denom = (constant * length * (series.iloc[1] / series.iloc[0]) ** 4)
-        series.iloc[1] = (series.iloc[0] + ((series.iloc[1] - series.iloc[0]) / denom))
-        return series.iloc[1]
-    mcg_cell = close[0:].rolling(2, min_periods=2).apply(mcg_, raw=False)
-    mcg_ds = close[:1].append(mcg_cell[1:])
+    MCGD[0] = close[0]
+    MCGD[i] = MCGD[i - 1] + (close[i] - MCGD[i - 1]) / (c * length * (close[i] / MCGD[i - 1]) ** 4)
 
 Args:
     close (pd.Series): Series of 'close's
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, pascals_triangle, verify_series, weights
+from pandas_ta.utils import get_offset, pascals_triangle, rolling_weights, verify_series
 
 
 def pwma(close, length=None, asc=None, offset=None, **kwargs):
@@ -14,7 +14,7 @@ def pwma(close, length=None, asc=None, offset=None, **kwargs):
 
     # Calculate Result
     triangle = pascals_triangle(n=length - 1, weighted=True)
-    pwma = close.rolling(length, min_periods=length).apply(weights(triangle), raw=True)
+    pwma = rolling_weights(close, triangle)
 
     # Offset
     if offset != 0:
@@ -2,7 +2,7 @@
 from numpy import pi as npPi
 from numpy import sin as npSin
 from pandas import Series
-from pandas_ta.utils import get_offset, verify_series, weights
+from pandas_ta.utils import get_offset, rolling_weights, verify_series
 
 
 def sinwma(close, length=None, offset=None, **kwargs):
@@ -18,7 +18,7 @@ def sinwma(close, length=None, offset=None, **kwargs):
     sines = Series([npSin((i + 1) * npPi / (length + 1)) for i in range(0, length)])
     w = sines / sines.sum()
 
-    sinwma = close.rolling(length, min_periods=length).apply(weights(w), raw=True)
+    sinwma = rolling_weights(close, w)
 
     # Offset
     if offset != 0:
@@ -3,6 +3,7 @@ from numpy import cos as npCos
 from numpy import exp as npExp
 from numpy import pi as npPi
 from numpy import sqrt as npSqrt
+from pandas import Series
 from pandas_ta.utils import get_offset, verify_series
 
 
@@ -17,8 +18,10 @@ def ssf(close, length=None, poles=None, offset=None, **kwargs):
     if close is None: return
 
     # Calculate Result
+    # The first 'poles' bars seed the recursion with close
     m = close.size
-    ssf = close.copy()
+    ssf = close.to_numpy(dtype=float, copy=True)
+    np_close = close.values
 
     if poles == 3:
         x = npPi / length # x = PI / n
@@ -31,8 +34,8 @@ def ssf(close, length=None, poles=None, offset=None, **kwargs):
         c2 = c0 + b0 # e^(-2x) + 2e^(-x)*cos(3^(.5) * x)
         c1 = 1 - c2 - c3 - c4
 
-        for i in range(0, m):
-            ssf.iloc[i] = c1 * close.iloc[i] + c2 * ssf.iloc[i - 1] + c3 * ssf.iloc[i - 2] + c4 * ssf.iloc[i - 3]
+        for i in range(3, m):
+            ssf[i] = c1 * np_close[i] + c2 * ssf[i - 1] + c3 * ssf[i - 2] + c4 * ssf[i - 3]
 
     else: # poles == 2
         x = npPi * npSqrt(2) / length # x = PI * 2^(.5) / n
@@ -41,8 +44,10 @@ def ssf(close, length=None, poles=None, offset=None, **kwargs):
         b1 = 2 * a0 * npCos(x) # 2e^(-x)*cos(x)
         c1 = 1 - a1 - b1 # e^(-2x) - 2e^(-x)*cos(x) + 1
 
-        for i in range(0, m):
-            ssf.iloc[i] = c1 * close.iloc[i] + b1 * ssf.iloc[i - 1] + a1 * ssf.iloc[i - 2]
+        for i in range(2, m):
+            ssf[i] = c1 * np_close[i] + b1 * ssf[i - 1] + a1 * ssf[i - 2]
+
+    ssf = Series(ssf, index=close.index)
 
     # Offset
     if offset != 0:
@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
+from numpy import full as npFull
 from numpy import nan as npNaN
+from numpy import ones as npOnes
+from numpy import zeros as npZeros
 from pandas import DataFrame
 from pandas_ta.overlap import hl2
 from pandas_ta.volatility import atr
@@ -20,30 +23,31 @@ def supertrend(high, low, close, length=None, multiplier=None, offset=None, **kw
 
     # Calculate Results
     m = close.size
-    dir_, trend = [1] * m, [0] * m
-    long, short = [npNaN] * m, [npNaN] * m
+    dir_, trend = npOnes(m, dtype=int), npZeros(m)
+    long, short = npFull(m, npNaN), npFull(m, npNaN)
 
     hl2_ = hl2(high, low)
     matr = multiplier * atr(high, low, close, length)
-    upperband = hl2_ + matr
-    lowerband = hl2_ - matr
+    upperband = (hl2_ + matr).values
+    lowerband = (hl2_ - matr).values
+    np_close = close.values
 
     for i in range(1, m):
-        if close.iloc[i] > upperband.iloc[i - 1]:
+        if np_close[i] > upperband[i - 1]:
             dir_[i] = 1
-        elif close.iloc[i] < lowerband.iloc[i - 1]:
+        elif np_close[i] < lowerband[i - 1]:
             dir_[i] = -1
         else:
             dir_[i] = dir_[i - 1]
-            if dir_[i] > 0 and lowerband.iloc[i] < lowerband.iloc[i - 1]:
-                lowerband.iloc[i] = lowerband.iloc[i - 1]
-            if dir_[i] < 0 and upperband.iloc[i] > upperband.iloc[i - 1]:
-                upperband.iloc[i] = upperband.iloc[i - 1]
+            if dir_[i] > 0 and lowerband[i] < lowerband[i - 1]:
+                lowerband[i] = lowerband[i - 1]
+            if dir_[i] < 0 and upperband[i] > upperband[i - 1]:
+                upperband[i] = upperband[i - 1]
 
         if dir_[i] > 0:
-            trend[i] = long[i] = lowerband.iloc[i]
+            trend[i] = long[i] = lowerband[i]
         else:
-            trend[i] = short[i] = upperband.iloc[i]
+            trend[i] = short[i] = upperband[i]
 
     # Prepare DataFrame to return
     _props = f"_{length}_{multiplier}"
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+from pandas import Series
 from .ema import ema
 from pandas_ta import Imports
 from pandas_ta.utils import get_offset, verify_series
@@ -22,7 +23,7 @@ def tema(close, length=None, talib=None, offset=None, **kwargs):
         ema1 = ema(close=close, length=length, **kwargs)
         ema2 = ema(close=ema1, length=length, **kwargs)
         ema3 = ema(close=ema2, length=length, **kwargs)
-        tema = 3 * (ema1 - ema2) + ema3
+        tema = Series(3 * (ema1.values - ema2.values) + ema3.values, index=close.index)
 
     # Offset
     if offset != 0:
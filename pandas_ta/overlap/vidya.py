@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
+from numpy import maximum as npMaximum
 from numpy import nan as npNaN
-from pandas import Series
+from numpy import where as npWhere
+from numpy import zeros as npZeros
+from pandas import DataFrame, Series
 from pandas_ta.utils import get_drift, get_offset, verify_series
 
 
@@ -21,21 +24,22 @@ def vidya(close, length=None, drift=None, offset=None, **kwargs):
         wma like from pandas_ta.overlap import wma?
         Weird Circular TypeError!?!
         """
-        mom = source.diff(d)
-        positive = mom.copy().clip(lower=0)
-        negative = mom.copy().clip(upper=0).abs()
-        pos_sum = positive.rolling(n).sum()
-        neg_sum = negative.rolling(n).sum()
-        return (pos_sum - neg_sum) / (pos_sum + neg_sum)
+        mom = source.diff(d).values
+        sums = DataFrame({
+            "pos": npMaximum(mom, 0), "neg": npMaximum(-mom, 0)
+        }).rolling(n).sum().values
+        pos_sum, neg_sum = sums[:, 0], sums[:, 1]
+        return Series((pos_sum - neg_sum) / (pos_sum + neg_sum), index=source.index)
 
     # Calculate Result
     m = close.size
     alpha = 2 / (length + 1)
-    abs_cmo = _cmo(close, length, drift).abs()
-    vidya = Series(0, index=close.index)
+    abs_cmo = _cmo(close, length, drift).abs().values
+    np_close = close.values
+    _vidya = npZeros(m)
     for i in range(length, m):
-        vidya.iloc[i] = alpha * abs_cmo.iloc[i] * close.iloc[i] + vidya.iloc[i - 1] * (1 - alpha * abs_cmo.iloc[i])
-    vidya.replace({0: npNaN}, inplace=True)
+        _vidya[i] = alpha * abs_cmo[i] * np_close[i] + _vidya[i - 1] * (1 - alpha * abs_cmo[i])
+    vidya = Series(npWhere(_vidya == 0, npNaN, _vidya), index=close.index)
 
     # Offset
     if offset != 0:
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+from pandas import DataFrame
 from .hlc3 import hlc3
 from pandas_ta.utils import get_offset, is_datetime_ordered, verify_series
 
@@ -19,9 +20,12 @@ def vwap(high, low, close, volume, anchor=None, offset=None, **kwargs):
         print(f"[!] VWAP price series is not datetime ordered. Results may not be as expected.")
 
     # Calculate Result
+    # Convert the index to anchor periods once and accumulate both sums
+    # in a single groupby pass
     wp = typical_price * volume
-    vwap  = wp.groupby(wp.index.to_period(anchor)).cumsum()
-    vwap /= volume.groupby(volume.index.to_period(anchor)).cumsum()
+    anchor_period = volume.index.to_period(anchor)
+    cumulative = DataFrame({"wp": wp, "vol": volume}).groupby(anchor_period).cumsum()
+    vwap = cumulative["wp"] / cumulative["vol"]
 
     # Offset
     if offset != 0:
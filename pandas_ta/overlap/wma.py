@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
-from pandas import Series
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, rolling_weights, verify_series
 
 
 def wma(close, length=None, asc=None, talib=None, offset=None, **kwargs):
@@ -21,19 +20,12 @@ def wma(close, length=None, asc=None, talib=None, offset=None, **kwargs):
         wma = WMA(close, length)
     else:
         from numpy import arange as npArange
-        from numpy import dot as npDot
 
         total_weight = 0.5 * length * (length + 1)
-        weights_ = Series(npArange(1, length + 1))
+        weights_ = npArange(1, length + 1)
         weights = weights_ if asc else weights_[::-1]
 
-        def linear(w):
-            def _compute(x):
-                return npDot(x, w) / total_weight
-            return _compute
-
-        close_ = close.rolling(length, min_periods=length)
-        wma = close_.apply(linear(weights), raw=True)
+        wma = rolling_weights(close, weights) / total_weight
 
     # Offset
     if offset != 0:
@@ -21,7 +21,7 @@ def stdev(close, length=None, ddof=None, talib=None, offset=None, **kwargs):
         from talib import STDDEV
         stdev = STDDEV(close, length)
     else:
-        stdev = variance(close=close, length=length, ddof=ddof).apply(npsqrt)
+        stdev = npsqrt(variance(close=close, length=length, ddof=ddof))
 
     # Offset
     if offset != 0:
@@ -49,7 +49,7 @@ Calculation:
     Default Inputs:
         length=30
     VAR = Variance
-    STDEV = variance(close, length).apply(np.sqrt)
+    STDEV = np.sqrt(variance(close, length))
 
 Args:
     close (pd.Series): Series of 'close's
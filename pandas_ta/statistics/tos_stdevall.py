@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 from numpy import array as npArray
 from numpy import arange as npArange
+from numpy import empty as npEmpty
 from numpy import polyfit as npPolyfit
 from numpy import std as npStd
 from pandas import DataFrame, DatetimeIndex, Series
@@ -39,13 +40,19 @@ def tos_stdevall(close, length=None, stds=None, ddof=None, offset=None, **kwargs
     lr = Series(m * X + b, index=src_index)
     stdev = npStd(close, ddof=ddof)
 
+    # All band levels in one broadcast pass over the regression line,
+    # written into a single block: LR, L_1, U_1, L_2, U_2, ...
+    deviations = npArray(stds) * stdev
+    bands = npEmpty((lr.size, 2 * len(stds) + 1))
+    bands[:, 0] = lr.values
+    bands[:, 1::2] = lr.values[:, None] - deviations
+    bands[:, 2::2] = lr.values[:, None] + deviations
+
     # Name and Categorize it
-    df = DataFrame({f"{_props}_LR": lr}, index=src_index)
+    columns = [f"{_props}_LR"]
     for i in stds:
-        df[f"{_props}_L_{i}"] = lr - i * stdev
-        df[f"{_props}_U_{i}"] = lr + i * stdev
-        df[f"{_props}_L_{i}"].name = df[f"{_props}_U_{i}"].name = f"{_props}"
-        df[f"{_props}_L_{i}"].category = df[f"{_props}_U_{i}"].category = "statistics"
+        columns += [f"{_props}_L_{i}", f"{_props}_U_{i}"]
+    df = DataFrame(bands, index=src_index, columns=columns)
 
     # Offset
     if offset != 0:
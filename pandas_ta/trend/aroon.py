@@ -1,8 +1,12 @@
 # -*- coding: utf-8 -*-
-from pandas import DataFrame
+from numpy import full as npFull
+from numpy import isnan as npIsnan
+from numpy import nan as npNaN
+from numpy.lib.stride_tricks import as_strided
+from numpy.version import version as npVersion
+from pandas import DataFrame, Series
 from pandas_ta import Imports
 from pandas_ta.utils import get_offset, verify_series
-from pandas_ta.utils import recent_maximum_index, recent_minimum_index
 
 
 def aroon(high, low, length=None, scalar=None, talib=None, offset=None, **kwargs):
@@ -23,8 +27,25 @@ def aroon(high, low, length=None, scalar=None, talib=None, offset=None, **kwargs
         aroon_down, aroon_up = AROON(high, low, length)
         aroon_osc = AROONOSC(high, low, length)
     else:
-        periods_from_hh = high.rolling(length + 1).apply(recent_maximum_index, raw=True)
-        periods_from_ll = low.rolling(length + 1).apply(recent_minimum_index, raw=True)
+        def _periods_from(x, most_recent_max):
+            """Bars since the most recent extreme over each length + 1 window"""
+            result = npFull(x.size, npNaN)
+            if x.size > length:
+                array, window = x.values, length + 1
+                if npVersion >= "1.20.0":
+                    from numpy.lib.stride_tricks import sliding_window_view
+                    windows = sliding_window_view(array, window)
+                else:
+                    shape = (array.size - window + 1, window)
+                    windows = as_strided(array, shape=shape, strides=2 * array.strides)
+                windows = windows[:, ::-1]
+                idx = windows.argmax(axis=1) if most_recent_max else windows.argmin(axis=1)
+                result[length:] = idx
+                result[length:][npIsnan(windows).any(axis=1)] = npNaN
+            return Series(result, index=x.index)
+
+        periods_from_hh = _periods_from(high, True)
+        periods_from_ll = _periods_from(low, False)
 
         aroon_up = aroon_down = scalar
         aroon_up *= 1 - (periods_from_hh / length)
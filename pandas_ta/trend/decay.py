@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 from numpy import exp as npExp
-from pandas import DataFrame
+from numpy import fmax as npFmax
+from pandas import Series
 from pandas_ta.utils import get_offset, verify_series
 
 
@@ -22,8 +23,7 @@ def decay(close, kind=None, length=None, mode=None, offset=None, **kwargs):
     else:  # "linear"
         diff = close.shift(1) - (1 / length)
     diff[0] = close[0]
-    tdf = DataFrame({"close": close, "diff": diff, "0": 0})
-    ld = tdf.max(axis=1)
+    ld = Series(npFmax(npFmax(close.values, diff.values), 0), index=close.index)
 
     # Offset
     if offset != 0:
@@ -1,6 +1,11 @@
 # -*- coding: utf-8 -*-
+from numpy import empty as npEmpty
+from numpy import fmax as npFmax
+from numpy import fmin as npFmin
+from numpy import full as npFull
 from numpy import nan as npNaN
-from pandas import DataFrame, Series
+from numpy import where as npWhere
+from pandas import DataFrame
 from pandas_ta.utils import get_offset, verify_series, zero
 
 
@@ -17,13 +22,14 @@ def psar(high, low, close=None, af0=None, af=None, max_af=None, offset=None, **k
     def _falling(high, low, drift:int=1):
         """Returns the last -DM value"""
         # Not to be confused with ta.falling()
-        up = high - high.shift(drift)
-        dn = low.shift(drift) - low
-        _dmn = (((dn > up) & (dn > 0)) * dn).apply(zero).iloc[-1]
-        return _dmn > 0
+        if high.size <= drift: return False
+        up = high[drift] - high[0]
+        dn = low[0] - low[drift]
+        _dmn = dn if dn > up and dn > 0 else 0
+        return zero(_dmn) > 0
 
     # Falling if the first NaN -DM is positive
-    falling = _falling(high.iloc[:2], low.iloc[:2])
+    falling = _falling(high.values[:2], low.values[:2])
     if falling:
         sar = high.iloc[0]
         ep = low.iloc[0]
@@ -35,36 +41,36 @@ def psar(high, low, close=None, af0=None, af=None, max_af=None, offset=None, **k
         close = verify_series(close)
         sar = close.iloc[0]
 
-    long = Series(npNaN, index=high.index)
-    short = long.copy()
-    reversal = Series(0, index=high.index)
-    _af = long.copy()
-    _af.iloc[0:2] = af0
-
     # Calculate Result
     m = high.shape[0]
+    np_high, np_low = high.values, low.values
+    # Prior two bar high/low extremes skipping NaN; row 1 only has bar 0
+    high2, low2 = npFull(m, npNaN), npFull(m, npNaN)
+    high2[1:], low2[1:] = np_high[:-1], np_low[:-1]
+    npFmax(high2[2:], np_high[:-2], out=high2[2:])
+    npFmin(low2[2:], np_low[:-2], out=low2[2:])
+    # Every bar after the first is written in the loop
+    sars, falls = npEmpty(m), npEmpty(m, dtype=bool)
+    _af, reversal = npEmpty(m), npEmpty(m, dtype=int)
+    sars[0], falls[0], _af[0], reversal[0] = npNaN, False, af0, 0
+
     for row in range(1, m):
-        high_ = high.iloc[row]
-        low_ = low.iloc[row]
+        high_ = np_high[row]
+        low_ = np_low[row]
+        _sar = sar + af * (ep - sar)
 
         if falling:
-            _sar = sar + af * (ep - sar)
             reverse = high_ > _sar
-
             if low_ < ep:
                 ep = low_
                 af = min(af + af0, max_af)
-
-            _sar = max(high.iloc[row - 1], high.iloc[row - 2], _sar)
+            _sar = max(high2[row], _sar)
         else:
-            _sar = sar + af * (ep - sar)
             reverse = low_ < _sar
-
             if high_ > ep:
                 ep = high_
                 af = min(af + af0, max_af)
-
-            _sar = min(low.iloc[row - 1], low.iloc[row - 2], _sar)
+            _sar = min(low2[row], _sar)
 
         if reverse:
             _sar = ep
@@ -73,34 +79,27 @@ def psar(high, low, close=None, af0=None, af=None, max_af=None, offset=None, **k
             ep = low_ if falling else high_
 
         sar = _sar # Update SAR
+        sars[row] = sar
+        falls[row] = falling
+        _af[row] = af
+        reversal[row] = reverse
 
-        # Seperate long/short sar based on falling
-        if falling:
-            short.iloc[row] = sar
-        else:
-            long.iloc[row] = sar
-
-        _af.iloc[row] = af
-        reversal.iloc[row] = int(reverse)
+    # Seperate long/short sar based on falling
+    long = npWhere(falls, npNaN, sars)
+    short = npWhere(falls, sars, npNaN)
 
     # Offset
     if offset != 0:
-        _af = _af.shift(offset)
-        long = long.shift(offset)
-        short = short.shift(offset)
-        reversal = reversal.shift(offset)
+        def _shift(x):
+            shifted = npFull(m, npNaN)
+            if offset > 0:
+                shifted[offset:] = x[:-offset]
+            else:
+                shifted[:offset] = x[-offset:]
+            return shifted
 
-    # Handle fills
-    if "fillna" in kwargs:
-        _af.fillna(kwargs["fillna"], inplace=True)
-        long.fillna(kwargs["fillna"], inplace=True)
-        short.fillna(kwargs["fillna"], inplace=True)
-        reversal.fillna(kwargs["fillna"], inplace=True)
-    if "fill_method" in kwargs:
-        _af.fillna(method=kwargs["fill_method"], inplace=True)
-        long.fillna(method=kwargs["fill_method"], inplace=True)
-        short.fillna(method=kwargs["fill_method"], inplace=True)
-        reversal.fillna(method=kwargs["fill_method"], inplace=True)
+        long, short = _shift(long), _shift(short)
+        _af, reversal = _shift(_af), _shift(reversal)
 
     # Prepare DataFrame to return
     _params = f"_{af0}_{max_af}"
@@ -110,9 +109,17 @@ def psar(high, low, close=None, af0=None, af=None, max_af=None, offset=None, **k
         f"PSARaf{_params}": _af,
         f"PSARr{_params}": reversal,
     }
-    psardf = DataFrame(data)
+    psardf = DataFrame(data, index=high.index)
+
+    # Handle fills
+    if "fillna" in kwargs:
+        psardf.fillna(kwargs["fillna"], inplace=True)
+    if "fill_method" in kwargs:
+        psardf.fillna(method=kwargs["fill_method"], inplace=True)
+
+    # Name and Categorize it
     psardf.name = f"PSAR{_params}"
-    psardf.category = long.category = short.category = "trend"
+    psardf.category = "trend"
 
     return psardf
 
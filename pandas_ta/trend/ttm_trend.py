@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
-from pandas import DataFrame
+from numpy import where as npWhere
+from pandas import DataFrame, Series
 from pandas_ta.overlap import hl2
 from pandas_ta.utils import get_offset, verify_series
 
@@ -16,14 +17,8 @@ def ttm_trend(high, low, close, length=None, offset=None, **kwargs):
     if high is None or low is None or close is None: return
 
     # Calculate Result
-    trend_avg = hl2(high, low)
-    for i in range(1, length):
-        trend_avg = trend_avg + hl2(high.shift(i), low.shift(i))
-
-    trend_avg = trend_avg / length
-
-    tm_trend = (close > trend_avg).astype(int)
-    tm_trend.replace(0, -1, inplace=True)
+    trend_avg = hl2(high, low).rolling(length).mean()
+    tm_trend = Series(npWhere(close > trend_avg, 1, -1), index=close.index)
 
     # Offset
     if offset != 0:
@@ -54,7 +54,7 @@ def is_percent(x: int or float) -> bool:
 def non_zero_range(high: Series, low: Series) -> Series:
     """Returns the difference of two series and adds epsilon to any zero values.  This occurs commonly in crypto data when 'high' = 'low'."""
     diff = high - low
-    if diff.eq(0).any().any():
+    if (diff.values == 0).any():
         diff += sflt.epsilon
     return diff
 
@@ -9,9 +9,11 @@ from numpy import ones, triu
 from numpy import all as npAll
 from numpy import append as npAppend
 from numpy import array as npArray
+from numpy import convolve as npConvolve
 from numpy import corrcoef as npCorrcoef
 from numpy import dot as npDot
 from numpy import fabs as npFabs
+from numpy import full as npFull
 from numpy import exp as npExp
 from numpy import log as npLog
 from numpy import nan as npNaN
@@ -163,6 +165,19 @@ def pascals_triangle(n: int = None, **kwargs: dict) -> npNdArray:
     return triangle
 
 
+def rolling_weights(series: Series, w: npNdArray) -> Series:
+    """Rolling dot product of the weights w with each len(w) window of series.
+
+    Same result as series.rolling(len(w)).apply(weights(w), raw=True) but
+    computed in one pass by numpy's convolve.
+    """
+    w = npArray(w, dtype=float)
+    n, result = w.size, npFull(series.size, npNaN)
+    if series.size >= n:
+        result[n - 1:] = npConvolve(series.values, w[::-1], mode="valid")
+    return Series(result, index=series.index)
+
+
 def symmetric_triangle(n: int = None, **kwargs: dict) -> Optional[List[int]]:
     """Symmetric Triangle with n >= 2
 
@@ -1,118 +1,131 @@
 # -*- coding: utf-8 -*-
+from numbers import Number
+
+from numpy import less as npLess
+from numpy import zeros as npZeros
 from pandas import DataFrame, Series
 
 from ._core import get_offset, verify_series
-from ._math import zero
 
 
-def _above_below(series_a: Series, series_b: Series, above: bool = True, asint: bool = True, offset: int = None, **kwargs):
-    series_a = verify_series(series_a)
-    series_b = verify_series(series_b)
-    offset = get_offset(offset)
+def _operand(x, index=None):
+    """Returns the values and name of a Series, on index, or numeric operand."""
+    if isinstance(x, Number):
+        return x, f"{x}".replace(".", "_")
+    x = verify_series(x)
+    if x is None:
+        raise TypeError("Operand must be a number or a pandas Series")
+    if index is not None and not x.index.equals(index):
+        raise ValueError("Can only compare identically-labeled Series objects")
+    return x.values, x.name
 
-    series_a.apply(zero)
-    series_b.apply(zero)
 
+def _above_below(series_a: Series, b, b_name: str, above: bool, asint: bool, offset: int) -> Series:
+    """Above/Below worker on a verified series_a and an _operand() b."""
     # Calculate Result
     if above:
-        current = series_a >= series_b
+        current = series_a.values >= b
     else:
-        current = series_a <= series_b
-
+        current = series_a.values <= b
     if asint:
         current = current.astype(int)
+    current = Series(current, index=series_a.index)
 
     # Offset
     if offset != 0:
         current = current.shift(offset)
 
     # Name & Category
-    current.name = f"{series_a.name}_{'A' if above else 'B'}_{series_b.name}"
+    current.name = f"{series_a.name}_{'A' if above else 'B'}_{b_name}"
     current.category = "utility"
 
     return current
 
 
+def _cross(series_a: Series, b, b_name: str, above: bool, asint: bool, offset: int) -> Series:
+    """Cross worker on a verified series_a and an _operand() b."""
+    # Calculate Result
+    a = series_a.values
+    current = a > b  # current is above
+    previous = npZeros(a.size, dtype=bool)  # previous is below
+    npLess(a[:-1], b if isinstance(b, Number) else b[:-1], out=previous[1:])
+    # above if both are true, below if both are false
+    cross = current & previous if above else ~(current | previous)
+    if asint:
+        cross = cross.astype(int)
+    cross = Series(cross, index=series_a.index)
+
+    # Offset
+    if offset != 0:
+        cross = cross.shift(offset)
+
+    # Name & Category
+    cross.name = f"{series_a.name}_{'XA' if above else 'XB'}_{b_name}"
+    cross.category = "utility"
+
+    return cross
+
+
 def above(series_a: Series, series_b: Series, asint: bool = True, offset: int = None, **kwargs):
-    return _above_below(series_a, series_b, above=True, asint=asint, offset=offset, **kwargs)
+    series_a = verify_series(series_a)
+    return _above_below(series_a, *_operand(series_b, series_a.index), above=True, asint=asint, offset=get_offset(offset))
 
 
 def above_value(series_a: Series, value: float, asint: bool = True, offset: int = None, **kwargs):
     if not isinstance(value, (int, float, complex)):
         print("[X] value is not a number")
         return
-    series_b = Series(value, index=series_a.index, name=f"{value}".replace(".", "_"))
-
-    return _above_below(series_a, series_b, above=True, asint=asint, offset=offset, **kwargs)
+    return above(series_a, value, asint=asint, offset=offset, **kwargs)
 
 
 def below(series_a: Series, series_b: Series, asint: bool = True, offset: int = None, **kwargs):
-    return _above_below(series_a, series_b, above=False, asint=asint, offset=offset, **kwargs)
+    series_a = verify_series(series_a)
+    return _above_below(series_a, *_operand(series_b, series_a.index), above=False, asint=asint, offset=get_offset(offset))
 
 
 def below_value(series_a: Series, value: float, asint: bool = True, offset: int = None, **kwargs):
     if not isinstance(value, (int, float, complex)):
         print("[X] value is not a number")
         return
-    series_b = Series(value, index=series_a.index, name=f"{value}".replace(".", "_"))
-    return _above_below(series_a, series_b, above=False, asint=asint, offset=offset, **kwargs)
+    return below(series_a, value, asint=asint, offset=offset, **kwargs)
 
 
 def cross_value(series_a: Series, value: float, above: bool = True, asint: bool = True, offset: int = None, **kwargs):
-    series_b = Series(value, index=series_a.index, name=f"{value}".replace(".", "_"))
-
-    return cross(series_a, series_b, above, asint, offset, **kwargs)
+    return cross(series_a, value, above, asint, offset, **kwargs)
 
 
 def cross(series_a: Series, series_b: Series, above: bool = True, asint: bool = True, offset: int = None, **kwargs):
     series_a = verify_series(series_a)
-    series_b = verify_series(series_b)
-    offset = get_offset(offset)
-
-    series_a.apply(zero)
-    series_b.apply(zero)
-
-    # Calculate Result
-    current = series_a > series_b  # current is above
-    previous = series_a.shift(1) < series_b.shift(1)  # previous is below
-    # above if both are true, below if both are false
-    cross = current & previous if above else ~current & ~previous
-
-    if asint:
-        cross = cross.astype(int)
-
-    # Offset
-    if offset != 0:
-        cross = cross.shift(offset)
-
-    # Name & Category
-    cross.name = f"{series_a.name}_{'XA' if above else 'XB'}_{series_b.name}"
-    cross.category = "utility"
-
-    return cross
+    return _cross(series_a, *_operand(series_b, series_a.index), above=above, asint=asint, offset=get_offset(offset))
 
 
 def signals(indicator, xa, xb, cross_values, xserie, xserie_a, xserie_b, cross_series, offset) -> DataFrame:
-    df = DataFrame()
+    # Validate once and call the workers directly
+    indicator = verify_series(indicator)
+    offset = get_offset(offset)
+    data = {}
+
     if xa is not None and isinstance(xa, (int, float)):
+        xa, xa_name = _operand(xa)
         if cross_values:
-            crossed_above_start = cross_value(indicator, xa, above=True, offset=offset)
-            crossed_above_end = cross_value(indicator, xa, above=False, offset=offset)
-            df[crossed_above_start.name] = crossed_above_start
-            df[crossed_above_end.name] = crossed_above_end
+            crossed_above_start = _cross(indicator, xa, xa_name, above=True, asint=True, offset=offset)
+            crossed_above_end = _cross(indicator, xa, xa_name, above=False, asint=True, offset=offset)
+            data[crossed_above_start.name] = crossed_above_start
+            data[crossed_above_end.name] = crossed_above_end
         else:
-            crossed_above = above_value(indicator, xa, offset=offset)
-            df[crossed_above.name] = crossed_above
+            crossed_above = _above_below(indicator, xa, xa_name, above=True, asint=True, offset=offset)
+            data[crossed_above.name] = crossed_above
 
     if xb is not None and isinstance(xb, (int, float)):
+        xb, xb_name = _operand(xb)
         if cross_values:
-            crossed_below_start = cross_value(indicator, xb, above=True, offset=offset)
-            crossed_below_end = cross_value(indicator, xb, above=False, offset=offset)
-            df[crossed_below_start.name] = crossed_below_start
-            df[crossed_below_end.name] = crossed_below_end
+            crossed_below_start = _cross(indicator, xb, xb_name, above=True, asint=True, offset=offset)
+            crossed_below_end = _cross(indicator, xb, xb_name, above=False, asint=True, offset=offset)
+            data[crossed_below_start.name] = crossed_below_start
+            data[crossed_below_end.name] = crossed_below_end
         else:
-            crossed_below = below_value(indicator, xb, offset=offset)
-            df[crossed_below.name] = crossed_below
+            crossed_below = _above_below(indicator, xb, xb_name, above=False, asint=True, offset=offset)
+            data[crossed_below.name] = crossed_below
 
     # xseries is the default value for both xserie_a and xserie_b
     if xserie_a is None:
@@ -120,20 +133,24 @@ def signals(indicator, xa, xb, cross_values, xserie, xserie_a, xserie_b, cross_s
     if xserie_b is None:
         xserie_b = xserie
 
-    if xserie_a is not None and verify_series(xserie_a):
+    xserie_a = verify_series(xserie_a)
+    if xserie_a is not None:
+        xserie_a, xserie_a_name = _operand(xserie_a, indicator.index)
         if cross_series:
-            cross_serie_above = cross(indicator, xserie_a, above=True, offset=offset)
+            cross_serie_above = _cross(indicator, xserie_a, xserie_a_name, above=True, asint=True, offset=offset)
         else:
-            cross_serie_above = above(indicator, xserie_a, offset=offset)
+            cross_serie_above = _above_below(indicator, xserie_a, xserie_a_name, above=True, asint=True, offset=offset)
 
-        df[cross_serie_above.name] = cross_serie_above
+        data[cross_serie_above.name] = cross_serie_above
 
-    if xserie_b is not None and verify_series(xserie_b):
+    xserie_b = verify_series(xserie_b)
+    if xserie_b is not None:
+        xserie_b, xserie_b_name = _operand(xserie_b, indicator.index)
         if cross_series:
-            cross_serie_below = cross(indicator, xserie_b, above=False, offset=offset)
+            cross_serie_below = _cross(indicator, xserie_b, xserie_b_name, above=False, asint=True, offset=offset)
         else:
-            cross_serie_below = below(indicator, xserie_b, offset=offset)
+            cross_serie_below = _above_below(indicator, xserie_b, xserie_b_name, above=False, asint=True, offset=offset)
 
-        df[cross_serie_below.name] = cross_serie_below
+        data[cross_serie_below.name] = cross_serie_below
 
-    return df
+    return DataFrame(data)
@@ -18,18 +18,21 @@ def hwc(close, na=None, nb=None, nc=None, nd=None, scalar=None, channel_eval=Non
 
     # Calculate Result
     last_a = last_v = last_var = 0
-    last_f = last_price = last_result = close[0]
+    np_close = close.values
+    last_f = last_price = last_result = np_close[0]
     lower, result, upper = [], [], []
     chan_pct_width, chan_width = [], []
 
     m = close.size
+    _na, _nb, _nc, _nd = 1.0 - na, 1.0 - nb, 1.0 - nc, 1.0 - nd
     for i in range(m):
-        F = (1.0 - na) * (last_f + last_v + 0.5 * last_a) + na * close[i]
-        V = (1.0 - nb) * (last_v + last_a) + nb * (F - last_f)
-        A = (1.0 - nc) * last_a + nc * (V - last_v)
+        F = _na * (last_f + last_v + 0.5 * last_a) + na * np_close[i]
+        V = _nb * (last_v + last_a) + nb * (F - last_f)
+        A = _nc * last_a + nc * (V - last_v)
         result.append((F + V + 0.5 * A))
 
-        var = (1.0 - nd) * last_var + nd * (last_price - last_result) * (last_price - last_result)
+        error = last_price - last_result
+        var = _nd * last_var + nd * error * error
         stddev = npSqrt(last_var)
         upper.append(result[i] + scalar * stddev)
         lower.append(result[i] - scalar * stddev)
@@ -38,11 +41,11 @@ def hwc(close, na=None, nb=None, nc=None, nd=None, scalar=None, channel_eval=Non
             # channel width
             chan_width.append(upper[i] - lower[i])
             # channel percentage price position
-            chan_pct_width.append((close[i] - lower[i]) / (upper[i] - lower[i]))
+            chan_pct_width.append((np_close[i] - lower[i]) / (upper[i] - lower[i]))
             # print('channel_eval (width|percentageWidth):', chan_width[i], chan_pct_width[i])
 
         # update values
-        last_price = close[i]
+        last_price = np_close[i]
         last_a = A
         last_f = F
         last_v = V
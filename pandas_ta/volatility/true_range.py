@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
+from numpy import fabs as npFabs
+from numpy import fmax as npFmax
 from numpy import nan as npNaN
-from pandas import concat
+from pandas import Series
 from pandas_ta import Imports
 from pandas_ta.utils import get_drift, get_offset, non_zero_range, verify_series
 
@@ -20,11 +22,14 @@ def true_range(high, low, close, talib=None, drift=None, offset=None, **kwargs):
         from talib import TRANGE
         true_range = TRANGE(high, low, close)
     else:
-        high_low_range = non_zero_range(high, low)
-        prev_close = close.shift(drift)
-        ranges = [high_low_range, high - prev_close, prev_close - low]
-        true_range = concat(ranges, axis=1)
-        true_range = true_range.abs().max(axis=1)
+        # Pairwise NaN skipping maxima instead of a 3 column concat + max
+        high_low_range = npFabs(non_zero_range(high, low).values)
+        prev_close = close.shift(drift).values
+        true_range = npFmax(
+            high_low_range,
+            npFmax(npFabs(high.values - prev_close), npFabs(prev_close - low.values))
+        )
+        true_range = Series(true_range, index=close.index)
         true_range.iloc[:drift] = npNaN
 
     # Offset
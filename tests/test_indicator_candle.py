@@ -38,6 +38,23 @@ class TestCandle(TestCase):
         result = pandas_ta.ha(self.open, self.high, self.low, self.close)
         self.assertIsInstance(result, DataFrame)
         self.assertEqual(result.name, "Heikin-Ashi")
+        self.assertEqual(list(result.columns), ["HA_open", "HA_high", "HA_low", "HA_close"])
+        pdt.assert_index_equal(result.index, self.close.index)
+
+        ha_close = 0.25 * (self.open + self.high + self.low + self.close)
+        pdt.assert_series_equal(result["HA_close"], ha_close, check_names=False)
+        self.assertAlmostEqual(result["HA_open"].iloc[0], 0.5 * (self.open.iloc[0] + self.close.iloc[0]))
+        self.assertAlmostEqual(result["HA_open"].iloc[1], 0.5 * (result["HA_open"].iloc[0] + ha_close.iloc[0]))
+        self.assertTrue((result["HA_high"] >= result[["HA_open", "HA_close"]].max(axis=1)).all())
+        self.assertTrue((result["HA_low"] <= result[["HA_open", "HA_close"]].min(axis=1)).all())
+
+        # A NaN bar poisons the HA_open recurrence but not HA_high/HA_low
+        close = self.close.copy()
+        close.iloc[100] = None
+        result = pandas_ta.ha(self.open, self.high, self.low, close)
+        self.assertTrue(result["HA_open"].iloc[101:].isna().all())
+        pdt.assert_series_equal(result["HA_high"].iloc[102:], self.high.iloc[102:], check_names=False)
+        pdt.assert_series_equal(result["HA_low"].iloc[102:], self.low.iloc[102:], check_names=False)
 
     def test_cdl_pattern(self):
         result = pandas_ta.cdl_pattern(self.open, self.high, self.low, self.close, name="all")
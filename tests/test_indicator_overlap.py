@@ -336,6 +336,13 @@ class TestOverlap(TestCase):
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "SSF_10_3")
 
+        # Causal: the leading bars must not depend on the tail of the data
+        for poles in [2, 3]:
+            full = pandas_ta.ssf(self.close, poles=poles)
+            head = pandas_ta.ssf(self.close.iloc[:100], poles=poles)
+            pdt.assert_series_equal(full.iloc[:100], head)
+            pdt.assert_series_equal(full.iloc[:poles], self.close.iloc[:poles], check_names=False)
+
     def test_swma(self):
         result = pandas_ta.swma(self.close)
         self.assertIsInstance(result, Series)
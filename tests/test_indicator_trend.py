@@ -175,6 +175,10 @@ class TestTrend(TestCase):
             except Exception as ex:
                 error_analysis(psar, CORRELATION, ex)
 
+        result = pandas_ta.psar(self.high.iloc[:1], self.low.iloc[:1])
+        self.assertIsInstance(result, DataFrame)
+        self.assertEqual(result.shape, (1, 4))
+
     def test_qstick(self):
         result = pandas_ta.qstick(self.open, self.close)
         self.assertIsInstance(result, Series)
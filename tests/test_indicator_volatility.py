@@ -99,6 +99,12 @@ class TestVolatility(TestCase):
         self.assertIsInstance(result, DataFrame)
         self.assertEqual(result.name, "BBANDS_5_2.0")
 
+        unshifted = pandas_ta.bbands(self.close)
+        result = pandas_ta.bbands(self.close, offset=1)
+        self.assertIsInstance(result, DataFrame)
+        pdt.assert_frame_equal(result, unshifted.shift(1))
+        self.assertFalse(result["BBP_5_2.0"].equals(result["BBB_5_2.0"]))
+
     def test_donchian(self):
         result = pandas_ta.donchian(self.high, self.low)
         self.assertIsInstance(result, DataFrame)
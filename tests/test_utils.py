@@ -87,6 +87,9 @@ class TestUtilities(TestCase):
         self.assertEqual(result.name, "zero_A_a")
         npt.assert_array_equal(result, self.crosseddf["b"])
 
+        a, b = self.crosseddf["a"], self.crosseddf["zero"]
+        self.assertRaises(ValueError, self.utils.above, a.iloc[:-1], b.iloc[1:])
+
     def test_above_value(self):
         result = self.utils.above_value(self.crosseddf["a"], 0)
         self.assertIsInstance(result, Series)
@@ -134,6 +137,17 @@ class TestUtilities(TestCase):
         self.assertIsInstance(result, Series)
         npt.assert_array_equal(result, self.crosseddf["crossed"])
 
+        a, b = self.crosseddf["a"], self.crosseddf["b"]
+        self.assertRaises(ValueError, self.utils.cross, a.iloc[:-1], b.iloc[1:])
+
+    def test_cross_value(self):
+        result = self.utils.cross_value(self.crosseddf["a"], np.int64(0))
+        self.assertIsInstance(result, Series)
+        self.assertEqual(result.name, "a_XA_0")
+        npt.assert_array_equal(result, self.utils.cross_value(self.crosseddf["a"], 0))
+
+        self.assertRaises(TypeError, self.utils.cross_value, self.crosseddf["a"], "0")
+
     def test_cross_below(self):
         result = self.utils.cross(self.crosseddf["b"], self.crosseddf["a"], above=False)
         self.assertIsInstance(result, Series)
@@ -263,6 +277,25 @@ class TestUtilities(TestCase):
         npt.assert_array_equal(self.utils.pascals_triangle(n=5, weighted=True), array_5w)
         npt.assert_array_equal(self.utils.pascals_triangle(n=5, weighted=True, inverse=True), array_5iw)
 
+    def test_rolling_weights(self):
+        close = self.data["close"]
+        w = self.utils.pascals_triangle(n=4, weighted=True)
+        expected = close.rolling(w.size).apply(self.utils.weights(w), raw=True)
+        result = self.utils.rolling_weights(close, w)
+        self.assertIsInstance(result, Series)
+        npt.assert_allclose(result, expected)
+
+        short = close.iloc[:w.size - 1]
+        self.assertTrue(self.utils.rolling_weights(short, w).isna().all())
+
+    def test_signals(self):
+        rsi = pandas_ta.rsi(self.data["close"])
+        xserie = pandas_ta.sma(rsi, 5)
+        result = self.utils.signals(rsi, 70, 30, False, xserie, None, None, True, 0)
+        self.assertIsInstance(result, DataFrame)
+        self.assertEqual(list(result.columns), ["RSI_14_A_70", "RSI_14_B_30", "RSI_14_XA_SMA_5", "RSI_14_XB_SMA_5"])
+        self.assertTrue(result.index.equals(rsi.index))
+
     def test_symmetric_triangle(self):
         npt.assert_array_equal(self.utils.symmetric_triangle(), np.array([1,1]))
         npt.assert_array_equal(self.utils.symmetric_triangle(weighted=True), np.array([0.5, 0.5]))